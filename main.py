@@ -1,36 +1,152 @@
 import csv
-import json
+import functools
+import hashlib
+import heapq
+import html
 import os
 import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional, Set, Tuple
+from typing import Callable, FrozenSet, Iterator, List, Dict, Any, NamedTuple, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
+import orjson
 import requests
-import feedparser
 import yaml
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-SEEN_FILE = "seen.json"
+try:
+    # libyaml (C) quando disponível: mesmo comportamento do safe_load, parse bem mais rápido
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
 
+try:
+    import ahocorasick
+except ImportError:  # extensão C; sem ela cai no RegexKeywordMatcher
+    ahocorasick = None
 
-def load_config() -> dict:
-    with open("config.yaml", "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+CONFIG_FILE = "config.yaml"
+SEEN_FILE = "seen.txt"
+LEGACY_SEEN_FILE = "seen.json"
+CACHE_DIR = ".cache"
+ETAG_INDEX_FILE = os.path.join(CACHE_DIR, "etag.json")
+BOARD_CACHE_TTL = 3600
+HTTP_WORKERS = 16
+NEAR_DUP_JACCARD = 0.85
+TELEGRAM_CHUNK_CHARS = 4000
 
+# Parâmetros de tracking: não mudam a vaga, só a URL
+TRACKING_PARAMS = frozenset({"ref", "gh_src", "source", "trk", "fbclid", "gclid", "lever-source"})
 
-def load_seen() -> set:
+
+def build_session() -> requests.Session:
+    # Uma sessão só para o run inteiro: keep-alive + pool de conexões por host.
+    # Retry só em GET (padrão do urllib3), então o POST do Telegram nunca duplica mensagem.
+    session = requests.Session()
+    # Cabeçalhos fixos na sessão, não montados de novo a cada GET; JSON dos boards vem comprimido
+    session.headers.update({"User-Agent": "job-radar/2.0", "Accept-Encoding": "gzip, deflate"})
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = build_session()
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_WORD_RE = re.compile(r"\w+")
+_COMPANY_SUFFIXES = frozenset({
+    "inc", "ltd", "llc", "plc", "gmbh", "ag", "sa", "nv", "bv", "spa", "pte",
+    "co", "company", "corp", "corporation", "holdings", "holding",
+})
+
+
+def load_config(path: str = CONFIG_FILE) -> dict:
+    # Re-parse só se o arquivo mudou (mtime na chave do cache); vale quando o processo é reaproveitado
+    return parse_config(path, os.stat(path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
+def parse_config(path: str, mtime_ns: int) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=YamlSafeLoader) or {}
+
+
+def url_key(url: str) -> bytes:
+    # seen guarda um digest de 16 bytes por URL (blake2b da stdlib), não a URL inteira de 80-150 bytes
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=16).digest()
+
+
+def parse_seen_line(line: str) -> Tuple[bytes, bool]:
+    # Linha nova = digest em hex (32 chars); qualquer outra coisa é URL do formato antigo
+    if len(line) == 32:
+        try:
+            return bytes.fromhex(line), False
+        except ValueError:
+            pass
+    return url_key(line), True
+
+
+def load_seen() -> Set[bytes]:
     if not os.path.exists(SEEN_FILE):
-        return set()
+        return migrate_legacy_seen()
     try:
+        # Nem URL nem hex têm espaço: split() em C já descarta linhas vazias e \r de CRLF
         with open(SEEN_FILE, "r", encoding="utf-8") as f:
-            return set(json.load(f))
+            lines = f.read().split()
+    except OSError:
+        return set()
+
+    seen = set()
+    has_legacy = False
+    for line in lines:
+        key, legacy = parse_seen_line(line)
+        seen.add(key)
+        has_legacy = has_legacy or legacy
+    if has_legacy:
+        # URLs do formato antigo: converte o arquivo inteiro para digests uma vez só
+        rewrite_seen(seen)
+    return seen
+
+
+def migrate_legacy_seen() -> Set[bytes]:
+    # seen.json (lista JSON de URLs) -> seen.txt (um digest por linha), reescrito de forma atômica
+    if not os.path.exists(LEGACY_SEEN_FILE):
+        return set()
+    try:
+        with open(LEGACY_SEEN_FILE, "rb") as f:
+            seen = {url_key(url) for url in orjson.loads(f.read())}
     except Exception:
         return set()
+    rewrite_seen(seen)
+    return seen
 
 
-def save_seen(seen: set) -> None:
-    with open(SEEN_FILE, "w", encoding="utf-8") as f:
-        json.dump(sorted(list(seen)), f, ensure_ascii=False, indent=2)
+def rewrite_seen(seen: Set[bytes]) -> None:
+    tmp = f"{SEEN_FILE}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.writelines(f"{key.hex()}\n" for key in seen)
+    os.replace(tmp, SEEN_FILE)
+
+
+def save_seen(new_keys: List[bytes]) -> None:
+    # Append-only: só os digests novos do run vão para o disco, sem reescrever o histórico
+    if not new_keys:
+        return
+    with open(SEEN_FILE, "a+b") as f:
+        # Arquivo editado à mão sem \n final: sem isso o primeiro digest novo colaria na última linha
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        f.write("".join(f"{key.hex()}\n" for key in new_keys).encode("ascii"))
 
 
 def norm(s: str) -> str:
@@ -39,40 +155,185 @@ def norm(s: str) -> str:
 
 def strip_html(s: str) -> str:
     s = s or ""
-    s = re.sub("<[^<]+?>", " ", s)
-    return re.sub(r"\s+", " ", s).strip()
-
-
+    if "&lt;" in s and "<" not in s:
+        # Greenhouse manda o HTML escapado (&lt;p&gt;...): desescapa antes para as tags saírem.
+        # Com markup de verdade, &lt; é um "<" literal do texto e fica para o unescape do fim.
+        s = html.unescape(s)
+
+    # Sem regex: cada pedaço depois de um '<' só é tag se fechar com '>' (mesmo que <[^<]+?>)
+    parts = s.split("<")
+    out = [parts[0]]
+    for p in parts[1:]:
+        gt = p.find(">", 1)
+        if gt == -1:
+            out.append("<")
+            out.append(p)
+        else:
+            out.append(" ")
+            out.append(p[gt + 1:])
+    text = "".join(out)
+    if "&" in text:
+        # &amp;, &nbsp; etc. viram texto de verdade ("us&nbsp;gaap" passa a casar com "us gaap")
+        text = html.unescape(text)
+    return " ".join(text.split())
+
+
+@functools.lru_cache(maxsize=8192)
 def normalize_company_name(s: str) -> str:
     s = (s or "").lower()
     s = s.replace("&", " and ")
-    s = re.sub(r"[^\w\s]", " ", s)
-    s = re.sub(r"\b(inc|ltd|llc|plc|gmbh|ag|sa|s a|s\.a|nv|bv|spa|pte|pte\.|co|company|corp|corporation|holdings|holding)\b", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    tokens = _PUNCT_RE.sub(" ", s).split()
+
+    # Sufixo societário sai por lookup no frozenset; "S.A." vira os tokens "s" + "a"
+    out = []
+    i = 0
+    while i < len(tokens):
+        tok = tokens[i]
+        if tok == "s" and i + 1 < len(tokens) and tokens[i + 1] == "a":
+            i += 2
+            continue
+        if tok not in _COMPANY_SUFFIXES:
+            out.append(tok)
+        i += 1
+    return " ".join(out)
 
 
-def http_get_text(url: str, params: Optional[dict] = None, timeout: int = 45) -> Optional[str]:
+def http_get(url: str, params: Optional[dict] = None, headers: Optional[dict] = None, timeout: int = 45) -> Optional[requests.Response]:
     try:
-        headers = {"User-Agent": "job-radar/2.0"}
-        r = requests.get(url, headers=headers, params=params, timeout=timeout)
-        if r.status_code >= 400:
-            return None
-        return r.text
+        return _SESSION.get(url, headers=headers, params=params, timeout=timeout)
     except requests.RequestException:
         return None
 
 
+def http_get_bytes(url: str, params: Optional[dict] = None, timeout: int = 45) -> Optional[bytes]:
+    # Corpo cru: orjson/feedparser leem bytes direto, sem decodificar para str antes
+    r = http_get(url, params=params, timeout=timeout)
+    if r is None or r.status_code >= 400:
+        return None
+    return r.content
+
+
 def get_json(url: str, params: Optional[dict] = None) -> Optional[Any]:
-    txt = http_get_text(url, params=params)
-    if not txt:
+    raw = http_get_bytes(url, params=params)
+    if not raw:
         return None
     try:
-        return json.loads(txt)
-    except Exception:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return None
+
+
+# -----------------------
+# Cache em disco (.cache/<kind>/<sha1(url)>.<ext>); a idade vem do mtime do arquivo
+# -----------------------
+def cache_path(kind: str, key: str, ext: str) -> str:
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, kind, f"{digest}.{ext}")
+
+
+def read_cache(path: str, ttl_seconds: Optional[float] = None) -> Optional[bytes]:
+    # ttl_seconds=None aceita qualquer cópia, mesmo velha (fallback quando a rede falha)
+    try:
+        if ttl_seconds is not None and time.time() - os.path.getmtime(path) > ttl_seconds:
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def write_cache(path: str, body: bytes) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(body)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+# -----------------------
+# GET condicional (ETag / Last-Modified) para os boards GH/Lever:
+# .cache/etag.json guarda url -> {etag, last_modified, body_path}; 304 reaproveita o corpo em disco
+# -----------------------
+_etag_index: Optional[Dict[str, Dict[str, str]]] = None
+_etag_lock = threading.Lock()
+
+
+def load_etag_index() -> Dict[str, Dict[str, str]]:
+    global _etag_index
+    with _etag_lock:
+        if _etag_index is None:
+            try:
+                _etag_index = orjson.loads(read_cache(ETAG_INDEX_FILE) or b"{}")
+            except orjson.JSONDecodeError:
+                _etag_index = {}
+        return _etag_index
+
+
+def save_etag_index() -> None:
+    with _etag_lock:
+        if _etag_index is not None:
+            write_cache(ETAG_INDEX_FILE, orjson.dumps(_etag_index))
+
+
+def get_json_conditional(url: str, ttl_seconds: float = BOARD_CACHE_TTL) -> Optional[Any]:
+    body_path = cache_path("http", url, "json")
+
+    # Baixado há pouco (ex.: run manual logo depois do agendado): nem pergunta ao servidor
+    raw = read_cache(body_path, ttl_seconds)
+    if raw is None:
+        index = load_etag_index()
+        entry = index.get(url) or {}
+        headers = {}
+        if os.path.exists(body_path):
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        r = http_get(url, headers=headers)
+        if r is None:
+            return None
+        if r.status_code == 304:
+            raw = read_cache(body_path)
+            try:
+                os.utime(body_path)
+            except OSError:
+                pass
+        elif r.status_code >= 400:
+            return None
+        else:
+            raw = r.content
+            write_cache(body_path, raw)
+            with _etag_lock:
+                index[url] = {
+                    "etag": r.headers.get("ETag", ""),
+                    "last_modified": r.headers.get("Last-Modified", ""),
+                    "body_path": body_path,
+                }
+
+    if not raw:
+        return None
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
         return None
 
 
+def parallel_map(fn: Callable[[Any], Any], args: List[Any]) -> List[Any]:
+    # Tudo aqui é I/O de rede: roda as chamadas em paralelo, mantendo a ordem dos args
+    if not args:
+        return []
+    with ThreadPoolExecutor(max_workers=min(HTTP_WORKERS, len(args))) as ex:
+        return list(ex.map(fn, args))
+
+
+def get_json_many(reqs: List[Tuple[str, Optional[dict]]]) -> List[Optional[Any]]:
+    return parallel_map(lambda req: get_json(req[0], params=req[1]), reqs)
+
+
 # -----------------------
 # Company universe (Top 1000 global + Top 100 Brazil) via CompaniesMarketCap CSV
 # -----------------------
@@ -92,23 +353,39 @@ def parse_companiesmarketcap_csv(csv_text: str) -> List[str]:
     return out
 
 
-def fetch_companies_from_templates(templates: List[str], pages: int = 1) -> List[str]:
-    names: List[str] = []
-    for page in range(1, pages + 1):
-        page_ok = False
-        for tpl in templates:
-            url = tpl.format(page=page)
-            txt = http_get_text(url)
-            if not txt:
-                continue
-            parsed = parse_companiesmarketcap_csv(txt)
-            if parsed:
-                names.extend(parsed)
-                page_ok = True
-                break
-        if not page_ok:
-            # Se uma página falha, seguimos mesmo assim (não derruba o job)
+def fetch_companies_page(templates: List[str], page: int, ttl_seconds: float) -> List[str]:
+    urls = [tpl.format(page=page) for tpl in templates]
+
+    # Cache ainda dentro do TTL: nem vai na rede
+    for url in urls:
+        parsed = parse_companiesmarketcap_csv((read_cache(cache_path("cmc", url, "csv"), ttl_seconds) or b"").decode("utf-8", errors="replace"))
+        if parsed:
+            return parsed
+
+    for url in urls:
+        raw = http_get_bytes(url)
+        if not raw:
             continue
+        parsed = parse_companiesmarketcap_csv(raw.decode("utf-8", errors="replace"))
+        if parsed:
+            write_cache(cache_path("cmc", url, "csv"), raw)
+            return parsed
+
+    # Rede falhou: usa a última cópia, mesmo vencida, para o universo não ficar vazio
+    for url in urls:
+        parsed = parse_companiesmarketcap_csv((read_cache(cache_path("cmc", url, "csv")) or b"").decode("utf-8", errors="replace"))
+        if parsed:
+            return parsed
+
+    # Se uma página falha, seguimos mesmo assim (não derruba o job)
+    return []
+
+
+def fetch_companies_from_templates(templates: List[str], pages: int = 1, ttl_seconds: float = 0) -> List[str]:
+    names: List[str] = []
+    results = parallel_map(lambda page: fetch_companies_page(templates, page, ttl_seconds), list(range(1, pages + 1)))
+    for parsed in results:
+        names.extend(parsed)
     return names
 
 
@@ -123,13 +400,16 @@ def load_company_universe(cfg: dict) -> Tuple[Set[str], Set[str], Set[str]]:
     global_tpls = cmc.get("global_url_templates") or []
     brazil_tpls = cmc.get("brazil_url_templates") or []
     extra = cu.get("extra_companies") or []
+    # O ranking muda devagar: global revalida 1x/semana, Brasil 1x/dia
+    global_ttl = float(cmc.get("global_cache_ttl_days", 7)) * 86400
+    brazil_ttl = float(cmc.get("brazil_cache_ttl_days", 1)) * 86400
 
     # Global: normalmente 100 por página no CSV -> 10 páginas = ~1000
     global_pages = max(1, (top_global + 99) // 100)
-    global_names = fetch_companies_from_templates(global_tpls, pages=global_pages)[:top_global]
+    global_names = fetch_companies_from_templates(global_tpls, pages=global_pages, ttl_seconds=global_ttl)[:top_global]
 
     # Brasil: uma única página CSV costuma trazer todas; se não, pega o que vier
-    brazil_names = fetch_companies_from_templates(brazil_tpls, pages=1)[:top_brazil]
+    brazil_names = fetch_companies_from_templates(brazil_tpls, pages=1, ttl_seconds=brazil_ttl)[:top_brazil]
 
     # Normaliza
     global_set = {normalize_company_name(x) for x in global_names if x}
@@ -156,7 +436,8 @@ def fetch_adzuna(cfg: dict) -> List[Dict[str, Any]]:
     pages_per_query = int(src.get("pages_per_query", 1))
     results_per_page = int(src.get("results_per_page", 50))
 
-    out = []
+    countries = []
+    reqs = []
     for q in queries:
         country = norm(q.get("country", "br"))
         what = q.get("what", "")
@@ -173,23 +454,26 @@ def fetch_adzuna(cfg: dict) -> List[Dict[str, Any]]:
             }
             if where:
                 params["where"] = where
+            countries.append(country)
+            reqs.append((url, params))
 
-            data = get_json(url, params=params)
-            if not data:
-                continue
+    out = []
+    for country, data in zip(countries, get_json_many(reqs)):
+        if not data:
+            continue
 
-            for j in data.get("results", []) or []:
-                company = (j.get("company") or {}).get("display_name", "") if isinstance(j.get("company"), dict) else ""
-                location = (j.get("location") or {}).get("display_name", "") if isinstance(j.get("location"), dict) else ""
-                out.append({
-                    "title": j.get("title", "") or "",
-                    "company": company or "",
-                    "location": location or "",
-                    "apply_url": j.get("redirect_url", "") or "",
-                    "description": j.get("description", "") or "",
-                    "source": f"adzuna:{country}",
-                    "date_posted": j.get("created", "") or "",
-                })
+        for j in data.get("results", []) or []:
+            company = (j.get("company") or {}).get("display_name", "") if isinstance(j.get("company"), dict) else ""
+            location = (j.get("location") or {}).get("display_name", "") if isinstance(j.get("location"), dict) else ""
+            out.append({
+                "title": j.get("title", "") or "",
+                "company": company or "",
+                "location": location or "",
+                "apply_url": j.get("redirect_url", "") or "",
+                "description": j.get("description", "") or "",
+                "source": f"adzuna:{country}",
+                "date_posted": j.get("created", "") or "",
+            })
 
     return out
 
@@ -197,10 +481,19 @@ def fetch_adzuna(cfg: dict) -> List[Dict[str, Any]]:
 # -----------------------
 # Remote sources
 # -----------------------
+def source_urls(sources: dict, name: str) -> List[str]:
+    # Aceita lista direta de URLs ou {enabled, urls} (formato do config.yaml)
+    src = sources.get(name) or []
+    if isinstance(src, dict):
+        if not src.get("enabled", True):
+            return []
+        src = src.get("urls") or []
+    return list(src)
+
+
 def fetch_remotive(urls: List[str]) -> List[Dict[str, Any]]:
     out = []
-    for url in urls:
-        data = get_json(url)
+    for data in get_json_many([(url, None) for url in urls]):
         if not data:
             continue
         for j in data.get("jobs", []) or []:
@@ -218,8 +511,7 @@ def fetch_remotive(urls: List[str]) -> List[Dict[str, Any]]:
 
 def fetch_remoteok(urls: List[str]) -> List[Dict[str, Any]]:
     out = []
-    for url in urls:
-        data = get_json(url)
+    for data in get_json_many([(url, None) for url in urls]):
         if not data or not isinstance(data, list):
             continue
         jobs = [x for x in data if isinstance(x, dict) and x.get("id")]
@@ -238,17 +530,23 @@ def fetch_remoteok(urls: List[str]) -> List[Dict[str, Any]]:
 
 def fetch_wwr_rss(urls: List[str]) -> List[Dict[str, Any]]:
     out = []
-    for url in urls:
-        feed = feedparser.parse(url)
-        for e in getattr(feed, "entries", []) or []:
+    for raw in parallel_map(http_get_bytes, urls):
+        if not raw:
+            continue
+        # Só 4 campos de RSS 2.0: o parser C da stdlib basta, sem feedparser
+        try:
+            root = ET.fromstring(raw)
+        except ET.ParseError:
+            continue
+        for item in root.iterfind(".//item"):
             out.append({
-                "title": e.get("title", "") or "",
+                "title": (item.findtext("title") or "").strip(),
                 "company": "",
                 "location": "",
-                "apply_url": e.get("link", "") or "",
-                "description": e.get("summary", "") or "",
+                "apply_url": (item.findtext("link") or "").strip(),
+                "description": item.findtext("description") or "",
                 "source": "weworkremotely",
-                "date_posted": e.get("published", "") or "",
+                "date_posted": (item.findtext("pubDate") or "").strip(),
             })
     return out
 
@@ -257,13 +555,11 @@ def fetch_wwr_rss(urls: List[str]) -> List[Dict[str, Any]]:
 # GH / Lever
 # -----------------------
 def fetch_greenhouse(boards: List[str]) -> List[Dict[str, Any]]:
+    boards = [b for b in ((b or "").strip() for b in boards) if b]
+    urls = [f"https://boards-api.greenhouse.io/v1/boards/{b}/jobs?content=true" for b in boards]
+
     out = []
-    for b in boards:
-        b = (b or "").strip()
-        if not b:
-            continue
-        url = f"https://boards-api.greenhouse.io/v1/boards/{b}/jobs?content=true"
-        data = get_json(url)
+    for b, data in zip(boards, parallel_map(get_json_conditional, urls)):
         if not data:
             continue
         for j in data.get("jobs", []) or []:
@@ -283,13 +579,11 @@ def fetch_greenhouse(boards: List[str]) -> List[Dict[str, Any]]:
 
 
 def fetch_lever(companies: List[str]) -> List[Dict[str, Any]]:
+    companies = [c for c in ((c or "").strip() for c in companies) if c]
+    urls = [f"https://api.lever.co/v0/postings/{c}?mode=json" for c in companies]
+
     out = []
-    for c in companies:
-        c = (c or "").strip()
-        if not c:
-            continue
-        url = f"https://api.lever.co/v0/postings/{c}?mode=json"
-        data = get_json(url)
+    for c, data in zip(companies, parallel_map(get_json_conditional, urls)):
         if not data or not isinstance(data, list):
             continue
         for j in data:
@@ -310,130 +604,324 @@ def fetch_lever(companies: List[str]) -> List[Dict[str, Any]]:
 # -----------------------
 # Filtering / scoring
 # -----------------------
+def canonical_url(url: str) -> str:
+    # Mesma vaga com utm_*/ref/#fragmento diferentes vira a mesma chave
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    ]
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
 def dedupe(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    seen = set()
-    out = []
+    # dict por URL canônica no lugar de set + lista: um setdefault por vaga, a primeira ocorrência
+    # fica e a ordem de inserção do dict preserva a ordem das fontes
+    by_url: Dict[str, Dict[str, Any]] = {}
     for it in items:
         url = (it.get("apply_url") or "").strip()
-        if not url:
-            continue
-        if url in seen:
-            continue
-        seen.add(url)
-        out.append(it)
-    return out
+        if url:
+            by_url.setdefault(canonical_url(url), it)
 
+    by_company: Dict[Tuple[str, str], List[Tuple[str, Set[str]]]] = {}
+    out = []
+    for it in by_url.values():
+        # Quase-duplicata entre fontes: mesma empresa e mesmo local, título com Jaccard alto nas palavras.
+        # Dentro da mesma fonte nunca descarta: um board repete o título em vários locais (Dublin, São Paulo...)
+        company = normalize_company_name(it.get("company", "") or "")
+        if company:
+            source = it.get("source") or ""
+            tokens = set((it.get("title") or "").lower().split())
+            kept = by_company.setdefault((company, norm(it.get("location"))), [])
+            if any(src != source and jaccard(tokens, other) >= NEAR_DUP_JACCARD for src, other in kept):
+                continue
+            kept.append((source, tokens))
 
-def is_brazil_job(location: str, cfg: dict) -> bool:
-    loc = norm(location)
-    return any(norm(k) in loc for k in cfg.get("brazil_location_keywords", []) or [])
+        out.append(it)
+    return out
 
 
-def is_remote_job(job: Dict[str, Any], cfg: dict) -> bool:
+# Classe de cada lista do config no autômato único (vale a primeira chave presente;
+# o config.yaml chama a lista de domínio de domain_keywords_in_title)
+KEYWORD_CLASSES = {
+    "target": ("target_title_keywords",),
+    "excl": ("exclude_title_keywords",),
+    "must": ("must_contain_any_of", "domain_keywords_in_title"),
+    "br_loc": ("brazil_location_keywords",),
+    "remote": ("remote_keywords",),
+    "nice": ("nice_keywords_desc",),
+}
+# Exclusões que casam como substring (radicais): "estagi" pega estagiário/estagiárias/estagiando,
+# "supervisor" pega supervisora(s). As de exclude_title_keywords de uma palavra só casam inteiras.
+EXCL_STEM_KEYS = ("exclude_title_stems",)
+# CFO passa no filtro de domínio mesmo sem nenhuma keyword de finanças no título
+ALWAYS_FINANCE_TITLES = ("cfo", "chief financial officer")
+# Nenhuma keyword contém \x00, então um match nunca atravessa dois campos
+SEGMENT_SEP = "\x00"
+
+KeywordHits = Dict[str, Set[str]]
+KeywordValue = Tuple[str, FrozenSet[str]]
+
+
+class RegexKeywordMatcher:
+    # Fallback sem pyahocorasick: uma alternação compilada (maior keyword primeiro) dentro de um
+    # lookahead acha o maior match em cada posição numa chamada só ao re; as keywords que são
+    # prefixo dele também casam ali. Mesmo iter() do Automaton: (índice do último char, valor).
+    def __init__(self, words: Dict[str, KeywordValue]):
+        ordered = sorted(words, key=len, reverse=True)
+        self._re = re.compile("(?=(" + "|".join(re.escape(w) for w in ordered) + "))")
+        self._words = words
+        self._prefixes = {w: [p for p in ordered if p != w and w.startswith(p)] for w in ordered}
+
+    def iter(self, text: str) -> Iterator[Tuple[int, KeywordValue]]:
+        for m in self._re.finditer(text):
+            longest = m.group(1)
+            for kw in (longest, *self._prefixes[longest]):
+                yield m.start() + len(kw) - 1, self._words[kw]
+
+
+class ScoreConfig(NamedTuple):
+    # Tudo que o score usa, já convertido/normalizado uma vez por run
+    keywords: Any  # ahocorasick.Automaton ou RegexKeywordMatcher
+    excl_tokens: FrozenSet[str]
+    target_kws: List[str]
+    has_nice_kws: bool
+    require_remote_outside_brazil: bool
+    company_universe_enabled: bool
+    bonus_extra: int
+    bonus_global: int
+    bonus_brazil: int
+    min_score: int
+    max_items: int
+
+
+def config_keywords(cfg: dict, keys: Tuple[str, ...]) -> List[str]:
+    for key in keys:
+        if key in cfg:
+            return [norm(k) for k in cfg.get(key) or []]
+    return []
+
+
+def excl_title_tokens(cfg: dict) -> FrozenSet[str]:
+    # Exclusões de uma palavra só casam com a palavra inteira do título: como substring,
+    # "intern" derrubava "International Tax Director" e "hr" qualquer título com "chro"
+    return frozenset(kk for kk in config_keywords(cfg, KEYWORD_CLASSES["excl"]) if _WORD_RE.fullmatch(kk))
+
+
+def title_token_forms(t_norm: str) -> Set[str]:
+    # Cada palavra do título e o singular ingênuo (-s/-es): pega plurais regulares ("gerentes",
+    # "analysts", "internships"), mas não gênero nem derivados; esses vão em exclude_title_stems
+    forms = set()
+    for tok in _WORD_RE.findall(t_norm):
+        forms.add(tok)
+        if tok.endswith("s"):
+            forms.add(tok[:-1])
+            if tok.endswith("es"):
+                forms.add(tok[:-2])
+    return forms
+
+
+def build_keyword_automaton(cfg: dict) -> Any:
+    # Um Aho-Corasick só para todas as listas: cada keyword leva as classes em que aparece
+    # (menos as exclusões de uma palavra, que vão por token em normalize_job)
+    excl_tokens = excl_title_tokens(cfg)
+    classes: Dict[str, Set[str]] = {}
+    for cls, keys in KEYWORD_CLASSES.items():
+        for kk in config_keywords(cfg, keys):
+            if kk and not (cls == "excl" and kk in excl_tokens):
+                classes.setdefault(kk, set()).add(cls)
+    for kk in config_keywords(cfg, EXCL_STEM_KEYS):
+        if kk:
+            classes.setdefault(kk, set()).add("excl")
+    for kk in ALWAYS_FINANCE_TITLES:
+        classes.setdefault(kk, set()).add("must")
+
+    if ahocorasick is None:
+        return RegexKeywordMatcher({kk: (kk, frozenset(cls)) for kk, cls in classes.items()})
+
+    automaton = ahocorasick.Automaton()
+    for kk, cls in classes.items():
+        automaton.add_word(kk, (kk, frozenset(cls)))
+    automaton.make_automaton()
+    return automaton
+
+
+def scan_keywords(automaton: Any, segments: List[str]) -> List[KeywordHits]:
+    # Uma passada no texto concatenado; devolve, por segmento, classe -> keywords achadas
+    hits: List[KeywordHits] = [{} for _ in segments]
+
+    seg_ends = []
+    pos = 0
+    for seg in segments:
+        pos += len(seg)
+        seg_ends.append(pos)
+        pos += len(SEGMENT_SEP)
+
+    seg = 0
+    for end, (kw, classes) in automaton.iter(SEGMENT_SEP.join(segments)):
+        while end >= seg_ends[seg]:
+            seg += 1
+        for cls in classes:
+            hits[seg].setdefault(cls, set()).add(kw)
+    return hits
+
+
+def build_score_config(cfg: dict) -> ScoreConfig:
+    # Normaliza as listas, monta o autômato e converte os números uma vez por run, e não a cada vaga
+    cu = cfg.get("company_universe") or {}
+    return ScoreConfig(
+        keywords=build_keyword_automaton(cfg),
+        excl_tokens=excl_title_tokens(cfg),
+        target_kws=[kk for kk in config_keywords(cfg, KEYWORD_CLASSES["target"]) if kk],
+        has_nice_kws=any(config_keywords(cfg, KEYWORD_CLASSES["nice"])),
+        require_remote_outside_brazil=bool(cfg.get("require_remote_outside_brazil", True)),
+        company_universe_enabled=bool(cu.get("enabled", True)),
+        bonus_extra=int(cu.get("bonus_extra", 14)),
+        bonus_global=int(cu.get("bonus_global", 10)),
+        bonus_brazil=int(cu.get("bonus_brazil", 8)),
+        min_score=int(cfg.get("min_score_to_send", 74)),
+        max_items=int(cfg.get("max_items_per_day", 20)),
+    )
+
+
+def is_brazil_job(loc_hits: KeywordHits) -> bool:
+    return "br_loc" in loc_hits
+
+
+def is_remote_job(job: Dict[str, Any], *segment_hits: KeywordHits) -> bool:
     src = (job.get("source") or "").lower()
     if src in {"remotive", "remoteok", "weworkremotely"}:
         return True
+    return any("remote" in hits for hits in segment_hits)
 
-    text = " ".join([
-        norm(job.get("location", "")),
-        norm(job.get("title", "")),
-        norm(strip_html(job.get("description", ""))),
-    ])
-    return any(norm(k) in text for k in cfg.get("remote_keywords", []) or [])
 
+def should_exclude_title(title_hits: KeywordHits) -> bool:
+    return "excl" in title_hits
 
-def should_exclude_title(title: str, cfg: dict) -> bool:
-    t = norm(title)
-    return any(norm(b) in t for b in cfg.get("exclude_title_keywords", []) or [])
 
+def must_be_finance_domain(title_hits: KeywordHits) -> bool:
+    return "must" in title_hits
 
-def must_be_finance_domain(title: str, cfg: dict) -> bool:
-    t = norm(title)
-    if "cfo" in t or "chief financial officer" in t:
-        return True
-    must = cfg.get("must_contain_any_of", []) or []
-    return any(norm(k) in t for k in must)
 
+def passes_title_filters(title_hits: KeywordHits) -> bool:
+    if should_exclude_title(title_hits):
+        return False
+    return must_be_finance_domain(title_hits)
 
-def title_match_score(title: str, cfg: dict) -> int:
-    t = norm(title)
 
-    for k in cfg.get("target_title_keywords", []) or []:
-        kk = norm(k)
-        if kk and kk in t:
-            return 78
+# Faixas do fuzzy de título: (partial_ratio mínimo, pontos). Abaixo da menor faixa não pontua,
+# então ela é o score_cutoff do rapidfuzz e ele abandona o par assim que não dá mais para chegar lá
+TITLE_FUZZY_BANDS = ((92, 68), (88, 58), (84, 48))
+TITLE_FUZZY_CUTOFF = TITLE_FUZZY_BANDS[-1][0]
 
-    best = 0
-    for k in cfg.get("target_title_keywords", []) or []:
-        kk = norm(k)
-        if kk:
-            best = max(best, fuzz.partial_ratio(kk, t))
-
-    if best >= 92:
-        return 68
-    if best >= 88:
-        return 58
-    if best >= 84:
-        return 48
+
+def title_fuzz_scores(titles: List[str], target_kws: List[str]) -> List[float]:
+    # Matriz keywords × títulos numa chamada só (C++, todos os cores); melhor score por título.
+    # Fica em float: dtype inteiro arredonda (91.6 -> 92) e mudaria a faixa.
+    if not titles or not target_kws:
+        return [0.0] * len(titles)
+    scores = process.cdist(target_kws, titles, scorer=fuzz.partial_ratio, score_cutoff=TITLE_FUZZY_CUTOFF, workers=-1)
+    return scores.max(axis=0).tolist()
+
+
+def title_match_score(t_norm: str, target_kws: List[str], title_hits: KeywordHits, fuzz_best: Optional[float] = None) -> int:
+    if "target" in title_hits:
+        return 78
+
+    if fuzz_best is not None:
+        best = fuzz_best
+    else:
+        match = process.extractOne(t_norm, target_kws, scorer=fuzz.partial_ratio, score_cutoff=TITLE_FUZZY_CUTOFF)
+        best = match[1] if match else 0
+
+    for min_ratio, points in TITLE_FUZZY_BANDS:
+        if best >= min_ratio:
+            return points
     return 0
 
 
-def company_bonus(company: str, br: bool, global_set: Set[str], brazil_set: Set[str], extra_set: Set[str], cfg: dict) -> int:
-    cu = cfg.get("company_universe") or {}
-    if not cu.get("enabled", True):
-        return 0
+CompanyBonusTable = Dict[str, Tuple[int, int]]
 
-    c = normalize_company_name(company)
-    bonus = 0
 
-    if c in extra_set:
-        bonus += int(cu.get("bonus_extra", 14))
+def build_company_bonus_table(global_set: Set[str], brazil_set: Set[str], extra_set: Set[str], sc: ScoreConfig) -> CompanyBonusTable:
+    # nome normalizado -> (bônus sempre, bônus extra se a vaga é no Brasil): um lookup por vaga em vez de três
+    table: CompanyBonusTable = {}
+    if not sc.company_universe_enabled:
+        return table
+    for c in global_set | brazil_set | extra_set:
+        base = (sc.bonus_extra if c in extra_set else 0) + (sc.bonus_global if c in global_set else 0)
+        table[c] = (base, sc.bonus_brazil if c in brazil_set else 0)
+    return table
 
-    if c in global_set:
-        bonus += int(cu.get("bonus_global", 10))
 
-    if br and c in brazil_set:
-        bonus += int(cu.get("bonus_brazil", 8))
+def company_bonus(company: str, br: bool, table: CompanyBonusTable) -> int:
+    base, br_bonus = table.get(normalize_company_name(company), (0, 0))
+    return base + br_bonus if br else base
 
-    return bonus
 
+def combine_score(title_score: int, nice_hits: int, company_pts: int, br: bool, remote: bool) -> int:
+    # Só aritmética: toda a parte de texto já virou números/flags em score_job
+    score = title_score + min(3 * nice_hits, 24) + company_pts
+    if br:
+        score += 6
+    if remote:
+        score += 6
+    return max(0, min(score, 100))
 
-def score_job(job: Dict[str, Any], cfg: dict, global_set: Set[str], brazil_set: Set[str], extra_set: Set[str]) -> int:
-    title = job.get("title", "") or ""
-    desc = strip_html(job.get("description", "") or "")
-    loc = job.get("location", "") or ""
-    company = job.get("company", "") or ""
 
-    if should_exclude_title(title, cfg):
-        return 0
-    if not must_be_finance_domain(title, cfg):
-        return 0
+def normalize_job(job: Dict[str, Any], sc: ScoreConfig) -> None:
+    # Pré-processamento único por vaga: título e local normalizados e varridos numa passada só
+    # do autômato. A descrição fica de fora de propósito (strip_html é caro e só roda no score_job).
+    job["_t"] = norm(job.get("title"))
+    job["_loc"] = norm(job.get("location"))
+    job["_t_hits"], job["_loc_hits"] = scan_keywords(sc.keywords, [job["_t"], job["_loc"]])
+    excl = sc.excl_tokens.intersection(title_token_forms(job["_t"]))
+    if excl:
+        job["_t_hits"].setdefault("excl", set()).update(excl)
 
-    br = is_brazil_job(loc, cfg)
-    remote = is_remote_job(job, cfg)
 
-    if cfg.get("require_remote_outside_brazil", True) and (not br) and (not remote):
+def score_job(job: Dict[str, Any], sc: ScoreConfig, company_table: CompanyBonusTable) -> int:
+    # Do mais barato para o mais caro, saindo cedo: a maioria das vagas cai no título
+    # e nunca paga o strip_html da descrição. Título/local já vêm de normalize_job.
+    title_hits = job["_t_hits"]
+    if not passes_title_filters(title_hits):
         return 0
 
-    score = title_match_score(title, cfg)
+    # O score do título é o filtro que mais corta e aqui é só lookup (fuzzy já veio em lote):
+    # roda antes de local e descrição, e quem não casa nunca chega no strip_html
+    score = title_match_score(job["_t"], sc.target_kws, title_hits, job.get("_title_fuzz"))
     if score == 0:
         return 0
 
-    d = norm(desc)
-    kw_bonus = 0
-    for k in cfg.get("nice_keywords_desc", []) or []:
-        if norm(k) in d:
-            kw_bonus += 3
-    score += min(kw_bonus, 24)
+    loc_hits = job["_loc_hits"]
+    br = is_brazil_job(loc_hits)
 
-    score += company_bonus(company, br, global_set, brazil_set, extra_set, cfg)
+    # Descrição só é lida para o que ainda pode mudar o score: keywords "nice" (se o config tem
+    # alguma) ou remoto que fonte/título/local não resolveram. Sem isso, nada de strip_html.
+    remote = is_remote_job(job, title_hits, loc_hits)
+    desc_hits: KeywordHits = {}
+    desc = job.get("description") or ""
+    if desc and (sc.has_nice_kws or not remote):
+        # strip_html já devolve o texto sem espaços nas pontas, basta o lower()
+        desc_hits = scan_keywords(sc.keywords, [strip_html(desc).lower()])[0]
+        remote = remote or "remote" in desc_hits
 
-    if br:
-        score += 6
-    if remote:
-        score += 6
+    if sc.require_remote_outside_brazil and (not br) and (not remote):
+        return 0
 
-    return max(0, min(score, 100))
+    nice_hits = len(desc_hits.get("nice", ()))
+    company = job.get("company", "") or ""
+    company_pts = company_bonus(company, br, company_table)
+    return combine_score(score, nice_hits, company_pts, br, remote)
 
 
 def format_message(new_jobs: List[Dict[str, Any]]) -> str:
@@ -450,21 +938,68 @@ def format_message(new_jobs: List[Dict[str, Any]]) -> str:
         url = (j.get("apply_url") or "").strip()
         src = (j.get("source") or "").strip()
 
-        header = f"• [{score}] {title}"
+        # Pedaços numa lista e um join só, em vez de += criando uma string nova a cada campo
+        header = [f"• [{score}] {title}"]
         if company:
-            header += f" — {company}"
+            header.append(f" — {company}")
         if loc:
-            header += f" ({loc})"
+            header.append(f" ({loc})")
         if src:
-            header += f" [{src}]"
+            header.append(f" [{src}]")
 
-        lines.append(header)
+        lines.append("".join(header))
         lines.append(url)
         lines.append("")
 
     return "\n".join(lines).strip()
 
 
+def split_long_block(block: str, limit: int) -> List[str]:
+    # Bloco sozinho acima do limite (título/URL enormes): quebra por linha e, se a linha
+    # ainda não couber, corta no limite. Sem isso o sendMessage recusaria o lote inteiro.
+    pieces: List[str] = []
+    current = ""
+    for line in block.split("\n"):
+        while len(line) > limit:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(line[:limit])
+            line = line[limit:]
+        candidate = f"{current}\n{line}" if current else line
+        if len(candidate) <= limit:
+            current = candidate
+        else:
+            pieces.append(current)
+            current = line
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_message(text: str, limit: int = TELEGRAM_CHUNK_CHARS) -> List[str]:
+    # Telegram corta em 4096 caracteres: quebra entre vagas (blocos separados por linha em branco)
+    blocks: List[str] = []
+    for block in text.split("\n\n"):
+        if len(block) <= limit:
+            blocks.append(block)
+        else:
+            blocks.extend(split_long_block(block, limit))
+
+    chunks: List[str] = []
+    current = ""
+    for block in blocks:
+        candidate = f"{current}\n\n{block}" if current else block
+        if len(candidate) <= limit or not current:
+            current = candidate
+        else:
+            chunks.append(current)
+            current = block
+    if current:
+        chunks.append(current)
+    return chunks
+
+
 def send_telegram(text: str) -> None:
     token = os.environ.get("TELEGRAM_BOT_TOKEN")
     chat_id = os.environ.get("TELEGRAM_CHAT_ID")
@@ -472,72 +1007,91 @@ def send_telegram(text: str) -> None:
         raise RuntimeError("Faltam TELEGRAM_BOT_TOKEN e/ou TELEGRAM_CHAT_ID nos Secrets do GitHub.")
 
     url = f"https://api.telegram.org/bot{token}/sendMessage"
-    payload = {"chat_id": chat_id, "text": text, "disable_web_page_preview": True}
 
-    r = requests.post(url, json=payload, timeout=45)
-    if r.status_code >= 400:
-        raise RuntimeError(f"Telegram erro {r.status_code}: {r.text}")
+    # Em sequência de propósito: posts concorrentes podem chegar fora de ordem no chat
+    for chunk in split_message(text):
+        payload = {"chat_id": chat_id, "text": chunk, "disable_web_page_preview": True}
+        r = _SESSION.post(url, json=payload, timeout=45)
+        if r.status_code >= 400:
+            raise RuntimeError(f"Telegram erro {r.status_code}: {r.text}")
 
 
-def main():
-    cfg = load_config()
+def run(cfg: dict) -> None:
+    # Ponto de entrada único do pipeline; sessão HTTP e caches são singletons do módulo
+    sc = build_score_config(cfg)
     seen = load_seen()
 
-    # Carrega universo de empresas
-    global_set, brazil_set, extra_set = load_company_universe(cfg)
-
-    # Coleta vagas
+    # Coleta vagas: todas as fontes (e o universo de empresas) rodam ao mesmo tempo,
+    # cada uma com seu próprio fan-out de URLs
     sources = cfg.get("sources") or {}
+    watch = cfg.get("company_watchlist") or {}
+    fetchers = [
+        lambda: fetch_adzuna(cfg),
+        lambda: fetch_remotive(source_urls(sources, "remotive")),
+        lambda: fetch_remoteok(source_urls(sources, "remoteok")),
+        lambda: fetch_wwr_rss(source_urls(sources, "weworkremotely_rss")),
+        lambda: fetch_greenhouse(watch.get("greenhouse_boards", []) or []),
+        lambda: fetch_lever(watch.get("lever_companies", []) or []),
+    ]
     jobs: List[Dict[str, Any]] = []
+    with ThreadPoolExecutor(max_workers=len(fetchers) + 1) as ex:
+        universe = ex.submit(load_company_universe, cfg)
+        for batch in ex.map(lambda fetch: fetch(), fetchers):
+            jobs.extend(batch)
+        global_set, brazil_set, extra_set = universe.result()
+    save_etag_index()
 
-    jobs.extend(fetch_adzuna(cfg))
-
-    jobs.extend(fetch_remotive(sources.get("remotive", []) or []))
-    jobs.extend(fetch_remoteok(sources.get("remoteok", []) or []))
-    jobs.extend(fetch_wwr_rss(sources.get("weworkremotely_rss", []) or []))
-
-    watch = cfg.get("company_watchlist") or {}
-    jobs.extend(fetch_greenhouse(watch.get("greenhouse_boards", []) or []))
-    jobs.extend(fetch_lever(watch.get("lever_companies", []) or []))
+    company_table = build_company_bonus_table(global_set, brazil_set, extra_set, sc)
 
     jobs = dedupe(jobs)
+    for j in jobs:
+        normalize_job(j, sc)
+
+    # Fuzzy dos títulos em lote, só para quem passa nos filtros baratos de título
+    # e ainda não tem match exato de keyword alvo (esses já valem 78 pelo autômato)
+    candidates = [j for j in jobs if passes_title_filters(j["_t_hits"]) and "target" not in j["_t_hits"]]
+    fuzz_best = title_fuzz_scores([j["_t"] for j in candidates], sc.target_kws)
+    for j, best in zip(candidates, fuzz_best):
+        j["_title_fuzz"] = best
 
     scored = []
     for j in jobs:
-        s = score_job(j, cfg, global_set, brazil_set, extra_set)
+        s = score_job(j, sc, company_table)
         if s <= 0:
             continue
         j["score"] = s
         scored.append(j)
 
-    scored.sort(key=lambda x: x.get("score", 0), reverse=True)
-
-    min_score = int(cfg.get("min_score_to_send", 74))
-    max_items = int(cfg.get("max_items_per_day", 20))
-
-    new_jobs = []
+    # Filtra mínimo e já vistas antes e só então pega o top-K: nlargest é O(N log K),
+    # sem ordenar tudo (empates mantêm a ordem de chegada, como no sort estável)
+    eligible = []
     for j in scored:
-        url = (j.get("apply_url") or "").strip()
-        if not url or url in seen:
+        if j["score"] < sc.min_score:
             continue
-        if j.get("score", 0) < min_score:
-            continue
-        new_jobs.append(j)
-        if len(new_jobs) >= max_items:
-            break
+        url = (j.get("apply_url") or "").strip()
+        if url and url_key(url) not in seen:
+            eligible.append(j)
+    new_jobs = heapq.nlargest(sc.max_items, eligible, key=lambda x: x["score"])
 
     msg = format_message(new_jobs)
     send_telegram(msg)
 
+    newly_seen = []
     for j in new_jobs:
         url = (j.get("apply_url") or "").strip()
-        if url:
-            seen.add(url)
-    save_seen(seen)
+        key = url_key(url) if url else None
+        if key and key not in seen:
+            seen.add(key)
+            newly_seen.append(key)
+    save_seen(newly_seen)
 
     print(f"Fetched: {len(jobs)} | Scored: {len(scored)} | Sent: {len(new_jobs)}")
     print(f"Company universe loaded: global={len(global_set)} brazil={len(brazil_set)} extra={len(extra_set)}")
 
 
+def main():
+    run(load_config())
+
+
 if __name__ == "__main__":
     main()